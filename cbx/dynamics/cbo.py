@@ -1,5 +1,12 @@
+import numpy as np
+
 from .pdyn import CBXDynamic
 
+try: # optional dependency, used to fuse the update expression into one pass
+    import numexpr as ne
+except ImportError:
+    ne = None
+
 #%% CBO
 class CBO(CBXDynamic):
     r"""Consensus-based optimization (CBO) class
@@ -48,17 +55,34 @@ class CBO(CBXDynamic):
         None
         
         """
+        # gather the particle batch once; for the full ensemble this is just a view
+        x_batch = self.x[self.particle_idx]
+
         # update, consensus point, drift and energy
         self.consensus, energy = self.compute_consensus()
         self.energy[self.consensus_idx] = energy
-        self.drift = self.x[self.particle_idx] - self.consensus
+        self.drift = x_batch - self.consensus
+
 
-        
         # compute noise
         self.s = self.sigma * self.noise()
 
-        #  update particle positions
-        self.x[self.particle_idx] = (
-            self.x[self.particle_idx] -
-            self.correction(self.lamda * self.dt * self.drift) +
-            self.s)
\ No newline at end of file
+        #  update particle positions. The update is accumulated in-place on the
+        #  corrected drift to avoid intermediate copies of the ensemble
+        if (
+            ne is not None and self.correction_is_identity
+            and isinstance(x_batch, np.ndarray) and isinstance(self.s, np.ndarray)
+            and x_batch.dtype == np.float64
+        ):
+            # numexpr evaluates the whole right-hand side in one multi-threaded
+            # pass without temporaries
+            ne.evaluate('x - ldt * drift + s',
+                        local_dict={'x': x_batch, 'ldt': self.lamda * self.dt,
+                                    'drift': self.drift, 's': self.s},
+                        out=x_batch)
+        else:
+            update = self.correction(self.lamda * self.dt * self.drift)
+            update -= self.s
+            x_batch -= update
+        if self.particle_idx is not Ellipsis: # write back the gathered copy
+            self.x[self.particle_idx] = x_batch
\ No newline at end of file
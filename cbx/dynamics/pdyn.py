@@ -1,6 +1,6 @@
 #%%
 from ..noise import get_noise
-from ..correction import get_correction
+from ..correction import get_correction, no_correction
 from ..scheduler import scheduler, multiply
 from ..utils.termination import max_it_term
 from ..utils.history import track_x, track_energy, track_update_norm, track_consensus, track_drift, track_drift_mean
@@ -13,7 +13,6 @@ from numpy.typing import ArrayLike
 import numpy as np
 from numpy.lib.stride_tricks import as_strided
 from numpy.random import Generator, MT19937
-from scipy.special import logsumexp as logsumexp_scp
 
         
 class post_process_default:
@@ -151,6 +150,7 @@ class ParticleDynamic:
         # set and promote objective function
         self.init_f(f, f_dim, check_f_dims)
 
+        self.M_idx = np.arange(self.M) # run indices, cached for the per-step best-particle updates
         self.energy = float('inf') * np.ones((self.M,self.N)) # energy of the particles
         self.best_energy = float('inf') * np.ones(self.M,)
         self.best_particle = self.copy(self.x[:, 0, :])
@@ -199,6 +199,10 @@ class ParticleDynamic:
         self.d = x.shape[2:]
         self.ddims = tuple(i for i in range(2, x.ndim))
         self.x = self.copy(x)
+        if isinstance(self.x, np.ndarray):
+            # np.copy preserves the memory order of the input; enforce a C-contiguous
+            # ensemble so that the dimension axis is densely strided in all updates
+            self.x = np.ascontiguousarray(self.x)
         
 
     def init_f(self, f, f_dim, check_f_dims):
@@ -222,8 +226,31 @@ class ParticleDynamic:
             x = self.normal(0., 1., self.x.shape)
             if self.f(x).shape != (self.M,self.N):
                 raise ValueError("The given objective function does not return the correct shape!")
-            self.num_f_eval += self.N * np.ones((self.M,), dtype=int) # number of function evaluations
+            self.num_f_eval += self.N # number of function evaluations
     
+    def copy_to_buffer(self, buf, x):
+        """
+        Copy the array ``x`` into the pre-allocated buffer ``buf``.
+
+        If the buffer can be reused, i.e., both arrays are numpy arrays of matching
+        shape and dtype, the values are copied in-place with ``np.copyto``, avoiding
+        a fresh allocation per step. Otherwise, a new copy is returned.
+
+        Parameters:
+            buf: The buffer to copy into, or None if no buffer exists yet.
+            x: The array that should be copied.
+
+        Returns:
+            The buffer holding the copy of ``x``.
+        """
+        if (
+            isinstance(buf, np.ndarray) and isinstance(x, np.ndarray)
+            and buf.shape == x.shape and buf.dtype == x.dtype
+        ):
+            np.copyto(buf, x)
+            return buf
+        return self.copy(x)
+
     def pre_step(self,):
         """
         The pre-step function. This function is used in meth:`step` before the inner step is performed.
@@ -236,7 +263,7 @@ class ParticleDynamic:
             None
         """
         # save old positions
-        self.x_old = self.copy(self.x)
+        self.x_old = self.copy_to_buffer(getattr(self, 'x_old', None), self.x)
         
     def inner_step(self,):
         """
@@ -503,10 +530,10 @@ class ParticleDynamic:
         self.f_min_idx = self.energy.argmin(axis=-1)
         
         if hasattr(self, 'x_old'):
-            self.best_cur_particle = self.x_old[np.arange(self.M), self.f_min_idx, :]
+            self.best_cur_particle = self.x_old[self.M_idx, self.f_min_idx, :]
         else:
-            self.best_cur_particle = self.x[np.arange(self.M), self.f_min_idx, :]
-        self.best_cur_energy = self.energy[np.arange(self.M), self.f_min_idx]
+            self.best_cur_particle = self.x[self.M_idx, self.f_min_idx, :]
+        self.best_cur_energy = self.energy[self.M_idx, self.f_min_idx]
     
     def update_best_particle(self,):
         """
@@ -546,10 +573,19 @@ class compute_consensus_default:
     
     def __call__(self, energy, x, alpha):
         weights = - alpha * energy
-        coeff_expan = tuple([Ellipsis] + [None for i in range(x.ndim-2)])
-        coeffs = np.exp(weights - logsumexp_scp(weights, axis=-1, keepdims=True))[coeff_expan]
+        # exp-normalize trick: shifting by the maximum is numerically equivalent to
+        # subtracting the logsumexp, but avoids the additional log and exp evaluations
+        weights_max = np.max(np.asarray(weights), axis=-1, keepdims=True)
+        coeffs = np.exp(weights - weights_max)
+        coeffs = coeffs / coeffs.sum(axis=-1, keepdims=True)
         self.check_coeffs(coeffs)
-        return (x * coeffs).sum(axis=1, keepdims=True), energy
+        if isinstance(x, np.ndarray):
+            # contract over the particle axis directly, avoiding the x * coeffs temporary
+            consensus = np.einsum('MN...,MN->M...', x, coeffs)[:, None]
+        else:
+            coeff_expan = tuple([Ellipsis] + [None for i in range(x.ndim-2)])
+            consensus = (x * coeffs[coeff_expan]).sum(axis=1, keepdims=True)
+        return consensus, energy
     
     def _check_coeffs(self, coeffs):
         problem_idx = np.where(np.abs(coeffs.sum(axis=1)-1) > 0.1)[0]
@@ -569,8 +605,10 @@ class CBXDynamic(ParticleDynamic):
         f: Callable
             The function to optimize.
         noise: str or Callable, optional
-            A string can be one of 'isotropic', 'anisotropic', or 'sampling'. It is also possible 
+            A string can be one of 'isotropic', 'anisotropic', or 'sampling'. It is also possible
             to use a Callable instead of a string. This Callable needs to accept a single argument, which is the dynamic object. Default: 'isotropic'.
+            The noise is sampled with a generator that is independent of the global ``np.random`` state; for reproducible noise, pass a
+            pre-constructed model with a seeded generator, e.g., ``get_noise('isotropic', rng=42)``.
         batch_args: dict, optional
             The batch arguments. Default: None.
         dt: float, optional
@@ -794,7 +832,9 @@ class CBXDynamic(ParticleDynamic):
             self.correction_callable = correction
         else:
             raise ValueError('Invalid correction model! Choose from "no_correction", "heavi_side", or "heavi_side_reg" or a callable.')
-        
+        # no_correction is the identity, which allows skipping the call in the step
+        self.correction_is_identity = isinstance(self.correction_callable, no_correction)
+
     def correction(self, x: ArrayLike) -> ArrayLike:
         """
         Calculate the correction for the given input.
@@ -808,6 +848,8 @@ class CBXDynamic(ParticleDynamic):
             ndarray
                 The correction value.
         """
+        if self.correction_is_identity:
+            return x
         return self.correction_callable(self, x)
 
     def set_noise(self, noise) -> None:
@@ -860,7 +902,9 @@ class CBXDynamic(ParticleDynamic):
     
         """                       
         weights = - self.alpha * self.energy
-        coeffs = np.exp(weights - logsumexp_scp(weights, axis=(-1,), keepdims=True))
+        # shifted-exp softmax, see compute_consensus_default
+        coeffs = np.exp(weights - np.max(weights, axis=-1, keepdims=True))
+        coeffs = coeffs / coeffs.sum(axis=-1, keepdims=True)
       
         D = self.drift[...,None] * self.drift[...,None,:]
         D = np.sum(D * coeffs[..., None, None], axis = -3)
@@ -868,8 +912,8 @@ class CBXDynamic(ParticleDynamic):
                     
     def pre_step(self,):
         # save old positions
-        self.x_old = self.copy(self.x)
-        
+        self.x_old = self.copy_to_buffer(getattr(self, 'x_old', None), self.x)
+
         # set new batch indices
         self.set_batch_idx()
         
@@ -1,7 +1,6 @@
 import numpy as np
 from typing import Callable
 from numpy.typing import ArrayLike
-from scipy.special import logsumexp
 
 from .cbo import CBO
 
@@ -143,9 +142,12 @@ class Taz_kernel(kernel):
 #%% PolarCBO
 def compute_polar_consensus(energy, x, neg_log_eval, alpha = 1., kernel_factor = 1.):
     weights = -kernel_factor * neg_log_eval - alpha * energy[:,None,:]
-    coeffs = np.exp(weights - logsumexp(weights, axis=-1, keepdims=True))
-    coeff_expan = tuple([Ellipsis] + [None for i in range(x.ndim-2)])
-    c = np.sum(x[:,None,...] * coeffs[coeff_expan], axis=2)
+    # shifted-exp softmax, see compute_consensus_default
+    coeffs = np.exp(weights - np.max(weights, axis=-1, keepdims=True))
+    coeffs = coeffs / coeffs.sum(axis=-1, keepdims=True)
+    # contract over the particle axis directly, avoiding the broadcast-expanded
+    # (M, N, N, d) product of x and coeffs
+    c = np.einsum('MN...,MnN->Mn...', x, coeffs)
     return c, energy
 
 
@@ -82,13 +82,14 @@ class PSO(CBXDynamic):
             self.sigma_memory = sigma_memory
         
         self.energy = self.f(self.x)
-        self.num_f_eval += np.ones(self.M, dtype=int) * self.N # update number of function evaluations   
+        self.num_f_eval += self.N # update number of function evaluations
         
     def pre_step(self,):
         # save old positions
-        self.x_old = self.copy(self.x) # save old positions
-        self.y_old = self.copy(self.y) # save old positions
-        self.v_old = self.copy(self.v) # save old velocities
+        self.x_old = self.copy_to_buffer(getattr(self, 'x_old', None), self.x)
+        self.y_old = self.copy_to_buffer(getattr(self, 'y_old', None), self.y)
+        # save old velocities
+        self.v_old = self.copy_to_buffer(getattr(self, 'v_old', None), self.v)
         
         # set new batch indices
         self.set_batch_idx()
@@ -108,40 +109,57 @@ class PSO(CBXDynamic):
         
         mind = self.consensus_idx
         ind = self.particle_idx
+        # gather the particle batch once; for the full ensemble this is just a view
+        x_batch = self.x[ind]
+        y_batch = self.y[ind]
         # first update
-        self.consensus = self.compute_consensus(self.y[mind], self.energy[mind])        
-        self.drift = self.x[ind] - self.consensus
-        self.memory_diff = self.x[ind] - self.y[ind]
-        
+        self.consensus = self.compute_consensus(self.y[mind], self.energy[mind])
+        self.drift = x_batch - self.consensus
+        self.memory_diff = x_batch - y_batch
+
         # inter step
         self.s = self.sigma * self.noise()
         self.s_memory = self.sigma_memory * self.noise()
 
         # dynamcis update
         # velocities of particles
-        self.v[ind] = (
+        v_batch = (
             self.m * self.dt * self.v[ind] +
             self.correction(self.lamda * self.dt * self.drift) +
             self.lamda_memory * self.dt * self.memory_diff +
-            self.s + 
+            self.s +
             self.s_memory)/(self.m+self.gamma*self.dt)
-        
+        self.v[ind] = v_batch
+
         # momentaneous positions of particles
-        self.x[ind] = self.x[ind] + self.dt * self.v[ind]
-        
+        x_batch += self.dt * v_batch
+        if ind is not Ellipsis: # write back the gathered copy
+            self.x[ind] = x_batch
+
         # evaluation of objective function on all particles
-        energy_new = self.f(self.x[ind])    
-        self.num_f_eval += np.ones(self.M, dtype =int) * self.x[ind].shape[-2] # update number of function evaluations   
-        
+        energy_new = self.f(x_batch)
+        self.num_f_eval += energy_new.shape[-1] # update number of function evaluations
+
         # historical best positions of particles
-        energy_expand = tuple([Ellipsis] + [None for _ in range(self.x.ndim-2)]) 
-        self.y[ind] = self.y[ind] + ((self.energy>energy_new)[energy_expand]) * (self.x[ind] - self.y[ind])
-        self.energy = np.minimum(self.energy, energy_new)
+        energy_expand = tuple([Ellipsis] + [None for _ in range(self.x.ndim-2)])
+        improved = (energy_new < self.energy)[energy_expand]
+        if ind is Ellipsis and isinstance(self.y, np.ndarray) and isinstance(energy_new, np.ndarray):
+            # conditional move instead of mask-multiply, updating y and energy in-place
+            np.copyto(self.y, self.x, where=improved)
+            np.minimum(self.energy, energy_new, out=self.energy)
+        else:
+            self.y[ind] = y_batch + improved * (x_batch - y_batch)
+            self.energy = np.minimum(self.energy, energy_new)
 
         
     def compute_consensus(self, x_batch, energy) -> None:
         r"""Updates the weighted mean of the particles.
 
+        The consensus is computed on the historical best positions ``x_batch``
+        with their stored energies, so no additional evaluation of the
+        objective is required; each step evaluates :math:`f` exactly once, on
+        the updated momentaneous positions.
+
         Parameters
         ----------
         None
@@ -151,6 +169,6 @@ class PSO(CBXDynamic):
         None
 
         """
-        c, _ = self._compute_consensus(energy, self.x[self.consensus_idx], self.alpha[self.active_runs_idx, :])
+        c, _ = self._compute_consensus(energy, x_batch, self.alpha[self.active_runs_idx, :])
         return c
         
\ No newline at end of file
@@ -3,26 +3,29 @@ This module implements the noise methods for cbx dynamics
 """
 from typing import Callable
 from numpy.typing import ArrayLike
-from numpy.random import normal
+from numpy.random import default_rng
 import numpy as np
 
-def get_noise(name):
+def get_noise(name, rng=None):
     if name == 'isotropic':
-        return isotropic_noise()
+        return isotropic_noise(rng=rng)
     elif name == 'anisotropic':
-        return anisotropic_noise()
+        return anisotropic_noise(rng=rng)
     elif name == 'covariance' or name == 'sampling':
-        return covariance_noise()
+        return covariance_noise(rng=rng)
     else:
         raise NotImplementedError('Noise model {} not implemented'.format(name))
 
 
 class noise:
-    def __init__(self, 
-                 norm: Callable = None, 
-                 sampler: Callable = None):
+    def __init__(self,
+                 norm: Callable = None,
+                 sampler: Callable = None,
+                 rng=None):
         self.norm = norm if norm is not None else np.linalg.norm
-        self.sampler = sampler if sampler is not None else normal
+        self.sampler = sampler
+        self.rng = rng if isinstance(rng, np.random.Generator) else default_rng(rng)
+        self._z = None
     def __call__(self, dyn):
         """
         This function returns the noise vector for a given dynamic object. This is the function that is called in the dynamic object.
@@ -47,6 +50,47 @@ class noise:
         """
         raise NotImplementedError('Base class does not implement sample')
 
+    def sample_normal(self, shape, dtype=None) -> ArrayLike:
+        """
+        Draw standard normal samples of the given shape.
+
+        If a custom ``sampler`` was specified, it is called directly. Otherwise, the
+        samples are drawn with the ``numpy`` Generator ``self.rng`` into a buffer
+        that is reused between calls, which avoids one ensemble-sized allocation
+        per step. The buffer is only an intermediate of the noise computation, so
+        reusing it is safe.
+
+        Note
+        ----
+        The generator is independent of the legacy global ``np.random`` state, so
+        ``np.random.seed`` does not affect the noise. For reproducible noise,
+        construct the noise model with a seed or generator, e.g.
+        ``get_noise('isotropic', rng=42)``, and pass it to the dynamic via the
+        ``noise`` argument.
+
+        Parameters
+        ----------
+        shape
+            The shape of the sample to draw.
+        dtype, optional
+            The dtype of the sample. Only np.float32 and np.float64 are supported
+            by the generator; anything else (including dtypes of non-numpy
+            backends) falls back to float64.
+
+        Returns
+        -------
+        ArrayLike
+            The standard normal sample.
+        """
+        if self.sampler is not None:
+            return self.sampler(0, 1, size=shape)
+        if not (isinstance(dtype, np.dtype) and dtype in (np.dtype(np.float32), np.dtype(np.float64))):
+            dtype = np.dtype(np.float64)
+        if self._z is None or self._z.shape != shape or self._z.dtype != dtype:
+            self._z = np.empty(shape, dtype=dtype)
+        self.rng.standard_normal(dtype=dtype, out=self._z)
+        return self._z
+
 class isotropic_noise(noise):
     r"""
 
@@ -62,20 +106,25 @@ class isotropic_noise(noise):
     
     Parameters
     ----------
-    None
-    
+    rng : numpy.random.Generator or seed, optional
+        The generator used to sample the noise, or a seed for
+        ``np.random.default_rng``. The default is None, which uses an unseeded
+        generator.
+
     Note
     ----
-    Only the norm of the drift is used for the noise. Therefore, the noise vector is scaled with the same factor in each dimension, 
-    which motivates the name **isotropic**. 
+    Only the norm of the drift is used for the noise. Therefore, the noise vector is scaled with the same factor in each dimension,
+    which motivates the name **isotropic**.
     """
-    def __init__(self, 
-                 norm: Callable = None, 
-                 sampler: Callable = None):
-         super().__init__(norm = norm, sampler = sampler)
+    def __init__(self,
+                 norm: Callable = None,
+                 sampler: Callable = None,
+                 rng=None):
+         super().__init__(norm = norm, sampler = sampler, rng = rng)
 
     def __call__(self, dyn) -> ArrayLike:
-        return np.sqrt(dyn.dt) * self.sample(dyn.drift)
+        # dt**0.5 stays a weakly typed python scalar, preserving the drift dtype
+        return dyn.dt**0.5 * self.sample(dyn.drift)
 
     def sample(self, drift) -> ArrayLike:
         r'''
@@ -99,7 +148,7 @@ class isotropic_noise(noise):
         Only the norm of the drift is used for the noise. Therefore, the noise vector is scaled with the same factor in each dimension, 
         which motivates the name **isotropic**. 
         '''
-        z = self.sampler(0, 1, size=(drift.shape))
+        z = self.sample_normal(drift.shape, dtype=getattr(drift, 'dtype', None))
         return z * self.norm(drift, axis=-1, keepdims=True)
     
 
@@ -124,13 +173,15 @@ class anisotropic_noise(noise):
         which motivates the name **anisotropic**.
         """
 
-        def __init__(self, 
+        def __init__(self,
                      norm: Callable = None,
-                     sampler: Callable = None):
-            super().__init__(norm = norm, sampler = sampler)
+                     sampler: Callable = None,
+                     rng=None):
+            super().__init__(norm = norm, sampler = sampler, rng = rng)
 
         def __call__(self, dyn) -> ArrayLike:
-            return np.sqrt(dyn.dt) * self.sample(dyn.drift)
+            # dt**0.5 stays a weakly typed python scalar, preserving the drift dtype
+            return dyn.dt**0.5 * self.sample(dyn.drift)
 
         def sample(self, drift: ArrayLike) -> ArrayLike:
             r"""
@@ -153,7 +204,7 @@ class anisotropic_noise(noise):
             which motivates the name **anisotropic**.
             """
 
-            return self.sampler(0, 1, size=drift.shape) * drift
+            return self.sample_normal(drift.shape, dtype=getattr(drift, 'dtype', None)) * drift
         
 class covariance_noise(noise):
         r"""
@@ -167,11 +218,12 @@ class covariance_noise(noise):
 
         Here, :math:`\xi` is a random vector of size :math:`(d)` distributed according to :math:`\mathcal{N}(0,1)`.
         """
-        
-        def __init__(self, 
+
+        def __init__(self,
                      norm: Callable = None,
-                     sampler: Callable = None):
-            super().__init__(norm = norm, sampler = sampler)
+                     sampler: Callable = None,
+                     rng=None):
+            super().__init__(norm = norm, sampler = sampler, rng = rng)
 
         def __call__(self, dyn) -> ArrayLike:
              factor = np.sqrt((1/dyn.lamda) * (1 - np.exp(-dyn.dt)**2))[(...,) + (None,) * (dyn.x.ndim - 2)]
@@ -200,7 +252,7 @@ class covariance_noise(noise):
             
             """
 
-            z = self.sampler(0, 1, size = drift.shape) 
+            z = self.sample_normal(drift.shape, dtype=getattr(drift, 'dtype', None))
             return self.apply_cov_sqrt(Cov_sqrt, z)
         
         def apply_cov_sqrt(self, Cov_sqrt: ArrayLike, z:ArrayLike) -> ArrayLike:
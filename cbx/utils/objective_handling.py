@@ -71,9 +71,15 @@ class cbx_objective_fh(cbx_objective):
 class cbx_objective_f1D(cbx_objective_fh):
     def __init__(self, f):
         super().__init__(f)
-    
+
     def apply(self, x):
         x = np.atleast_2d(x)
+        if isinstance(self.f, cbx_objective):
+            # cbx_objective instances evaluate on full ensembles by contract, so
+            # the whole batch can be passed at once instead of looping over the
+            # particles with np.apply_along_axis
+            res = np.asarray(self.f.apply(x.reshape(-1, x.shape[-1])))
+            return res.reshape(-1, x.shape[-2])
         return np.apply_along_axis(self.f, 1, x.reshape(-1, x.shape[-1])).reshape(-1,x.shape[-2])
     
     
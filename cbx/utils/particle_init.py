@@ -1,8 +1,8 @@
 import numpy as np
 
-def init_particles(shape=(1,1,1), x_min=-1.0, x_max = 1.0, delta=1.0, method="uniform"):
+def init_particles(shape=(1,1,1), x_min=-1.0, x_max = 1.0, delta=1.0, method="uniform", rng=None, dtype=None):
     r"""Initialize particles
-    
+
     Parameters
     ----------
     N : int, optional
@@ -14,20 +14,26 @@ def init_particles(shape=(1,1,1), x_min=-1.0, x_max = 1.0, delta=1.0, method="un
     x_max : float, optional
         Upper bound for the uniform distribution. The default is 1.0.
     delta : float, optional
-        Standard deviation for the normal distribution. The default is 1.0.
+        Variance for the normal distribution. The default is 1.0.
     method : str, optional
         Method for initializing the particles. The default is "uniform".
         Possible values: "uniform", "normal"
-    
+    rng : numpy.random.Generator, optional
+        The generator used for sampling. The default is None, in which case
+        the legacy ``np.random`` interface is used.
+    dtype : numpy dtype, optional
+        The dtype of the particles, e.g., ``np.float32`` to run a dynamic in
+        single precision. The default is None, which keeps float64.
+
     Returns
     -------
     x : numpy.ndarray
         Array of particles of shape (N, d)
     """
 
-
+    rng = rng if rng is not None else np.random
     if method == "uniform":
-        x = np.random.uniform(x_min, x_max, shape)
+        x = rng.uniform(x_min, x_max, shape)
     elif method == "normal":
         if len(shape) == 3:
             M, N, d = shape
@@ -36,9 +42,14 @@ def init_particles(shape=(1,1,1), x_min=-1.0, x_max = 1.0, delta=1.0, method="un
             M = 1
         else:
             raise RuntimeError('Normal initialization only supported for 2D or 3D shapes!')
-        
-        x = np.random.multivariate_normal(np.zeros((d,)), delta * np.eye(d), (M, N))
+
+        # the covariance delta * I is diagonal, so we can sample standard normals
+        # directly instead of going through np.random.multivariate_normal, which
+        # factorizes the full d x d covariance matrix
+        x = np.sqrt(delta) * rng.standard_normal((M, N, d))
     else:
         raise RuntimeError('Unknown method for init_particles specified!')
-        
+
+    if dtype is not None:
+        x = x.astype(dtype, copy=False)
     return x
\ No newline at end of file
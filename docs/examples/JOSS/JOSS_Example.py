@@ -1,6 +1,7 @@
 import numpy as np
 import cbx as cbx
 import cbx.objectives as obj
+from cbx.noise import get_noise
 from cbx.utils.scheduler import scheduler, multiply
 from cbx.plotting import contour_2D
 import matplotlib.pyplot as plt
@@ -17,7 +18,8 @@ kwargs = {'alpha': 1.1,
          'track_list': ['x'],
          'max_it': 5000,
          'N': 5,
-         'M': 1,}
+         'M': 1,
+         'noise': get_noise('isotropic', rng=42),}
 
 #%% Set seed and define the objective function
 np.random.seed(42)
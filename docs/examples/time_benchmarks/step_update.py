@@ -0,0 +1,32 @@
+import numpy as np
+import cbx as cbx
+from cbx.dynamics import CBO
+from cbx.objectives import Quadratic
+import timeit
+
+np.random.seed(42)
+#%%
+conf = {'alpha': 40.0,
+        'dt': 0.01,
+        'sigma': 8.1,
+        'lamda': 1.0,
+        'max_it': 1000,
+        'track_args': {'names': []},
+        'verbosity': 0}
+
+#%% Time the full CBO step for different ensemble and problem sizes.
+# The update is a memory-bound fused-multiply-add over the ensemble; this
+# script measures how close the numpy path gets to that bound and serves as
+# the reference when judging kernel-level changes (in-place updates, einsum
+# consensus, buffered noise, ...).
+sizes = [(1, 100, 2), (1, 1000, 20), (10, 1000, 20), (10, 1000, 200)]
+
+for M, N, d in sizes:
+    x = cbx.utils.init_particles(shape=(M, N, d), x_min=-3., x_max=3.)
+    dyn = CBO(Quadratic(), x=x, noise='anisotropic', **conf)
+    T = timeit.Timer(dyn.step)
+    num_runs, total = T.autorange()
+    per_step = total / num_runs
+    num_bytes = 8 * M * N * d
+    print('M={:>3}, N={:>5}, d={:>4}: {:>10.3f} us/step, ~{:.2f} GB/s on the ensemble'.format(
+        M, N, d, 1e6 * per_step, 1e-9 * num_bytes / per_step))
@@ -133,6 +133,13 @@ class Test_cbo(test_abstract_dynamic):
         
         assert np.allclose(dyn.best_cur_particle, best_cur_particle)
 
+    def test_float32_step(self, f, dynamic):
+        '''Test if a float32 ensemble stays float32 after a step'''
+        x = np.random.uniform(-1,1,(2,5,3)).astype(np.float32)
+        dyn = dynamic(f, x=x)
+        dyn.step()
+        assert dyn.x.dtype == np.float32
+
     def test_anisotropic_noise(self, f, dynamic):
         dyn = dynamic(f, d=3, noise='anisotropic')
         dyn.step()
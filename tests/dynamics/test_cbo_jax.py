@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+jax = pytest.importorskip('jax')
+
+from cbx.dynamics.cbo_jax import cbo_step, cbo_run
+
+
+def f(x):
+    return (x**2).sum(axis=-1)
+
+
+def test_cbo_jax_step():
+    '''Test if one jax step preserves the ensemble shape'''
+    key = jax.random.PRNGKey(42)
+    x = jax.random.uniform(key, (3, 5, 7), minval=-1., maxval=1.)
+    x_new = cbo_step(f, x, key)
+    assert x_new.shape == (3, 5, 7)
+
+
+def test_cbo_jax_consensus():
+    '''Test if the jax consensus agrees with the loop-based computation'''
+    from cbx.dynamics.cbo_jax import compute_consensus
+    alpha = 1.5
+    x = np.random.uniform(-1, 1, (3, 5, 7))
+    energy = f(x)
+    consensus = compute_consensus(jax.numpy.asarray(energy), jax.numpy.asarray(x), alpha)
+
+    mean = np.zeros((3, 1, 7))
+    for j in range(x.shape[0]):
+        loc_mean = 0
+        loc_denom = 0
+        for i in range(x.shape[1]):
+            loc_mean += np.exp(-alpha * energy[j, i]) * x[j, i, :]
+            loc_denom += np.exp(-alpha * energy[j, i])
+        mean[j, ...] = loc_mean / loc_denom
+
+    assert np.allclose(np.asarray(consensus), mean)
+
+
+def test_cbo_jax_run():
+    '''Test if a jax run moves the ensemble towards the minimizer'''
+    key = jax.random.PRNGKey(0)
+    x = jax.random.uniform(key, (2, 50, 2), minval=-2., maxval=2.)
+    x_new = cbo_run(f, x, key, num_steps=400, alpha=30., sigma=1., dt=0.05)
+    assert np.allclose(np.asarray(x_new).mean(axis=1), 0., atol=0.3)
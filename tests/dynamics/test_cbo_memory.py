@@ -14,6 +14,25 @@ class Test_cbo_memory(test_abstract_dynamic):
         dyn.step()
         assert dyn.it == 1
         
+    def test_consensus_compute(self, dynamic, f):
+        '''Test if consensus is computed on the historical best positions'''
+        x = np.random.uniform(-1,1,(3,5,7))
+        dyn = dynamic(f, x=x)
+        dyn.step()
+        dyn.step() # the historical bests y now differ from x
+        y = dyn.y_old
+        mean = np.zeros((3,1,7))
+
+        for j in range(y.shape[0]):
+            loc_mean = 0
+            loc_denom = 0
+            for i in range(y.shape[1]):
+                loc_mean += np.exp(-dyn.alpha[j] * f(y[j,i,:])) * y[j,i,:]
+                loc_denom += np.exp(-dyn.alpha[j] * f(y[j,i,:]))
+            mean[j,...] = loc_mean / loc_denom
+
+        assert np.allclose(dyn.consensus, mean)
+
     def test_update_best_cur_particle(self, f, dynamic):
         x = np.zeros((5,3,2))
         x[0, :,:] = np.array([[0.,0.], [2.,1.], [4.,5.]])
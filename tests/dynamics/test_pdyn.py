@@ -115,6 +115,15 @@ class Test_cbx(test_abstract_dynamic):
         assert np.allclose(g, gg)
         
         
+    def test_noise_seeding(self, f, dynamic):
+        '''Test if a seeded noise model gives reproducible noise'''
+        s = []
+        for _ in range(2):
+            dyn = dynamic(f, d=4, N=5, M=3, noise=cbx.noise.get_noise('isotropic', rng=42))
+            dyn.drift = np.ones(dyn.x.shape)
+            s.append(np.copy(dyn.noise()))
+        assert np.allclose(s[0], s[1])
+
     def test_update_cov(self, f, dynamic):
         M=7
         d=4
@@ -1,14 +1,34 @@
 from cbx.dynamics import PSO
 import pytest
 from test_abstraction import test_abstract_dynamic
+import numpy as np
 
 class Test_pso(test_abstract_dynamic):
-    
+
     @pytest.fixture
     def dynamic(self):
         return PSO
-    
+
     def test_step_eval(self, f, dynamic):
         dyn = dynamic(f, d=5, M=7, N=5)
         dyn.step()
-        assert dyn.it == 1
\ No newline at end of file
+        assert dyn.it == 1
+
+    def test_consensus_compute(self, dynamic, f):
+        '''Test if consensus is computed on the historical best positions'''
+        x = np.random.uniform(-1,1,(3,5,7))
+        dyn = dynamic(f, x=x)
+        dyn.step()
+        dyn.step() # the historical bests y now differ from x
+        y = dyn.y_old
+        mean = np.zeros((3,1,7))
+
+        for j in range(y.shape[0]):
+            loc_mean = 0
+            loc_denom = 0
+            for i in range(y.shape[1]):
+                loc_mean += np.exp(-dyn.alpha[j] * f(y[j,i,:])) * y[j,i,:]
+                loc_denom += np.exp(-dyn.alpha[j] * f(y[j,i,:]))
+            mean[j,...] = loc_mean / loc_denom
+
+        assert np.allclose(dyn.consensus, mean)
\ No newline at end of file
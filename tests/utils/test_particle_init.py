@@ -21,6 +21,11 @@ def test_particle_init_normal_wrong_shape():
     with pytest.raises(RuntimeError):
         init_particles(shape=(3,), method="normal")
 
+def test_particle_init_dtype():
+    '''Test if particles are initialized with the requested dtype'''
+    x = init_particles(shape=(3,5,7), dtype=np.float32)
+    assert x.dtype == np.float32
+
 def test_particle_init_unknown_method():
     '''Test if exception is raised when unknown method is specified'''
     with pytest.raises(RuntimeError):